@@ -1,68 +1,122 @@
 import sys
 import os
+import copy
 import json
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget,
     QPushButton, QListWidget, QLineEdit, QLabel, QMessageBox
 )
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QTimer, QUrl
-from screeninfo import get_monitors
+from PyQt5.QtGui import QIntValidator
+from PyQt5.QtCore import QCoreApplication, QTimer, QUrl, Qt
 
 CONFIG_FILE = "config.json"
 
+# 保存配置时延迟写盘的时间（毫秒），期间的多次保存只写一次
+SAVE_DEBOUNCE_MS = 500
+
+# config.json 当前内容在内存中的副本（尚未读写过时为 None）
+_CONFIG_CACHE = None
+
+# QWebEngineView 会拉起整个 Chromium，推迟到真正创建展示窗口时再导入
+_QWebEngineView = None
+
+def _get_webview_cls():
+    """首次调用时导入 QWebEngineView 并缓存，之后直接返回缓存的类。"""
+    global _QWebEngineView
+    if _QWebEngineView is None:
+        from PyQt5.QtWebEngineWidgets import QWebEngineView
+        _QWebEngineView = QWebEngineView
+    return _QWebEngineView
+
+def default_config():
+    """默认配置：config.json 不存在、读取失败或缺少字段时使用"""
+    return {
+        "urls": [
+            "https://example.com",
+            "https://example.org",
+            "https://example.net"
+        ],
+        "refresh_interval": 5000,
+        "mode": "single"
+    }
+
 def load_config():
-    """从 config.json 加载配置，如果没有则使用默认配置。"""
+    """从 config.json 加载配置，如果没有则使用默认配置。解析结果会被缓存。"""
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is not None:
+        return _CONFIG_CACHE
+
     if os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
-            # 如果文件内容里缺少某些字段，可以设置默认
-            urls = data.get("urls", [
-                "https://example.com",
-                "https://example.org",
-                "https://example.net"
-            ])
+            # 如果文件内容里缺少某些字段，可以设置默认（只在缺少时才构造默认网址列表）
+            urls = data.get("urls")
+            if urls is None:
+                urls = default_config()["urls"]
             refresh_interval = data.get("refresh_interval", 5000)
             mode = data.get("mode", "single")
-            return {
+            _CONFIG_CACHE = {
                 "urls": urls,
                 "refresh_interval": refresh_interval,
                 "mode": mode
             }
+            return _CONFIG_CACHE
         except Exception as e:
             print("加载配置文件出错，使用默认配置:", e)
     # 如果文件不存在或读取失败，返回默认配置
-    return {
-        "urls": [
-            "https://example.com",
-            "https://example.org",
-            "https://example.net"
-        ],
-        "refresh_interval": 5000,
-        "mode": "single"
-    }
+    return default_config()
 
 def save_config(urls, refresh_interval, mode):
-    """将当前设置保存到 config.json 中。"""
+    """将当前设置保存到 config.json 中。内容与文件中已有的一致时不写盘。"""
+    global _CONFIG_CACHE
     data = {
         "urls": urls,
         "refresh_interval": refresh_interval,
         "mode": mode
     }
+    if data == _CONFIG_CACHE:
+        return
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # 先在内存中序列化，一次写入临时文件再替换，避免中途崩溃留下写了一半的配置文件
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        tmp_file = CONFIG_FILE + ".tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_file, flags, 0o644)
+        try:
+            # os.write 可能只写入一部分，循环直到全部写完
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, CONFIG_FILE)
+        _CONFIG_CACHE = copy.deepcopy(data)
     except Exception as e:
         print("保存配置文件出错:", e)
 
+# format_url 认可的协议前缀，startswith 传入元组只需一次调用
+_SCHEMES = ("http://", "https://")
+
 def format_url(url_str):
     """如果用户没有输入 http:// 或 https://, 则自动补全为 https://"""
     url_str = url_str.strip()
-    if not (url_str.startswith("http://") or url_str.startswith("https://")):
+    if not url_str.startswith(_SCHEMES):
         url_str = "https://" + url_str
     return url_str
 
+def _teardown(win):
+    """关闭窗口并立即释放其中的 QWebEngineView，避免渲染进程等到 GC 才回收"""
+    view = getattr(win, "widget", None)
+    if view is not None:
+        # 先跳转到空白页，提前释放已加载的页面
+        view.setUrl(QUrl("about:blank"))
+        view.page().deleteLater()
+        view.deleteLater()
+    win.close()
+    win.deleteLater()
+
 class MainController:
     def __init__(self, initial_config):
         # 从配置中初始化
@@ -70,6 +124,17 @@ class MainController:
         self.urls = initial_config["urls"]
         self.refresh_interval = initial_config["refresh_interval"]
         self.windows = []
+        # 显示器信息只在多屏模式下需要，首次用到时再获取并缓存，
+        # 有显示器接入或拔出时清空缓存
+        self._monitors = None
+        app = QApplication.instance()
+        app.screenAdded.connect(self._invalidate_monitors)
+        app.screenRemoved.connect(self._invalidate_monitors)
+
+        # 所有窗口共用一个定时器，而不是每个窗口各自持有一个
+        self._tick_callbacks = []
+        self._tick_timer = QTimer()
+        self._tick_timer.timeout.connect(self._on_tick)
 
     def set_mode(self, mode):
         """设置模式并应用"""
@@ -84,11 +149,36 @@ class MainController:
         """设置刷新间隔（毫秒）"""
         self.refresh_interval = interval
 
+    def monitors(self):
+        """返回缓存的显示器列表，首次调用时才导入 screeninfo 并探测"""
+        if self._monitors is None:
+            from screeninfo import get_monitors
+            self._monitors = list(get_monitors())
+        return self._monitors
+
+    def refresh_monitors(self):
+        """丢弃缓存的显示器信息，下次使用时重新探测"""
+        self._monitors = None
+
+    def _invalidate_monitors(self, *_):
+        # screenAdded/screenRemoved 的槽函数（不需要 QScreen 参数）
+        self.refresh_monitors()
+
+    def register_tick(self, callback):
+        """注册一个回调，由共享定时器每隔 refresh_interval 毫秒调用一次"""
+        self._tick_callbacks.append(callback)
+
+    def _on_tick(self):
+        for callback in self._tick_callbacks:
+            callback()
+
     def apply_mode(self):
         """根据当前模式创建窗口并展示"""
-        # 先关闭并清空已有的窗口
+        # 先停止定时器，关闭并清空已有的窗口
+        self._tick_timer.stop()
+        self._tick_callbacks.clear()
         for win in self.windows:
-            win.close()
+            _teardown(win)
         self.windows.clear()
 
         if self.mode == "single":
@@ -102,6 +192,9 @@ class MainController:
         for win in self.windows:
             win.show()
 
+        if self._tick_callbacks:
+            self._tick_timer.start(self.refresh_interval)
+
     def _create_single_window(self):
         """创建单屏滚动窗口"""
         window = RefreshableWindow(
@@ -109,17 +202,20 @@ class MainController:
             self.refresh_interval,
             single_mode=True
         )
+        self.register_tick(window.refresh_content)
         return window
 
     def _create_multi_windows(self):
         """根据当前显示器数量和分辨率，创建多个窗口"""
-        monitors = get_monitors()
+        monitors = self.monitors()
         windows = []
         # 这里根据显示器数量做分配，比如有2个显示器:
         # 第0个显示器 -> self.urls[0], self.urls[2], ...
         # 第1个显示器 -> self.urls[1], self.urls[3], ...
-        for i, monitor in enumerate(monitors):
-            urls_for_window = self.urls[i::len(monitors)]
+        # 一次性算好每个显示器分到的网址
+        count = len(monitors)
+        chunks = [self.urls[i::count] for i in range(count)]
+        for monitor, urls_for_window in zip(monitors, chunks):
             if urls_for_window:
                 window = RefreshableWindow(
                     urls_for_window,
@@ -138,9 +234,11 @@ class RefreshableWindow(QMainWindow):
         self.refresh_interval = refresh_interval
         self.single_mode = single_mode
         self.current_index = 0
+        # 预先格式化好所有网址，定时器回调里只需按下标取用
+        self._qurls = [QUrl(format_url(u)) for u in self.urls]
 
         # 使用 QWebEngineView 显示网页
-        self.widget = QWebEngineView()
+        self.widget = _get_webview_cls()()
         self.setCentralWidget(self.widget)
 
         # 如果提供了屏幕信息，就把窗口放到对应屏幕
@@ -149,24 +247,17 @@ class RefreshableWindow(QMainWindow):
         else:
             self.setGeometry(100, 100, 800, 600)
 
-        # 定时器，用于滚动模式下周期刷新
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh_content)
-
         if self.single_mode:
-            # 单屏滚动模式：启动定时器并刷新
-            self.timer.start(self.refresh_interval)
+            # 单屏滚动模式：先显示第一个，之后由 MainController 的共享定时器驱动
             self.refresh_content()
         else:
             # 多屏模式：只显示第一个网址，不滚动
-            first_url = format_url(self.urls[0])
-            self.widget.setUrl(QUrl(first_url))
+            self.widget.setUrl(self._qurls[0])
 
     def refresh_content(self):
         """在单屏滚动模式下，每隔一段时间切换到下一网址"""
         if self.single_mode:
-            target_url = format_url(self.urls[self.current_index])
-            self.widget.setUrl(QUrl(target_url))
+            self.widget.setUrl(self._qurls[self.current_index])
             self.current_index = (self.current_index + 1) % len(self.urls)
 
 
@@ -175,6 +266,12 @@ class SettingsWindow(QMainWindow):
         super().__init__()
         self.controller = controller
 
+        # 合并短时间内的多次保存，由定时器统一写盘
+        self._pending_cfg = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._do_flush)
+
         self.setWindowTitle("设置窗口")
         self.setGeometry(50, 50, 400, 600)
 
@@ -213,6 +310,7 @@ class SettingsWindow(QMainWindow):
         self.refresh_input = QLineEdit()
         self.refresh_input.setPlaceholderText("例如：5000 表示 5 秒")
         # 将当前的刷新间隔显示在输入框
+        self.refresh_input.setValidator(QIntValidator(1, 3_600_000, self))
         self.refresh_input.setText(str(self.controller.refresh_interval))
         layout.addWidget(self.refresh_input)
 
@@ -260,34 +358,45 @@ class SettingsWindow(QMainWindow):
 
     def save_settings(self):
         """读取界面输入的内容并应用到控制器，并保存到 JSON 文件"""
+        # 先检查刷新间隔，无效时不做任何修改。校验器允许本地化的千位分隔符
+        # （如 "5,000"），所以用同一 locale 解析，而不是直接 int()
+        refresh_interval, ok = self.refresh_input.locale().toInt(self.refresh_input.text())
+        if not self.refresh_input.hasAcceptableInput() or not ok:
+            QMessageBox.warning(self, "警告", "请输入有效的数字！")
+            return
+
         # 获取列表中的所有网址
         urls = [
             self.url_list.item(i).text()
             for i in range(self.url_list.count())
         ]
         self.controller.set_urls(urls)
-
-        # 尝试解析刷新间隔
-        try:
-            refresh_interval = int(self.refresh_input.text())
-            self.controller.set_refresh_interval(refresh_interval)
-        except ValueError:
-            QMessageBox.warning(self, "警告", "请输入有效的数字！")
-            return
+        self.controller.set_refresh_interval(refresh_interval)
 
         # 应用新的设置
         self.controller.apply_mode()
 
-        # 最后，将当前设置写回到 config.json
-        save_config(
-            urls=self.controller.urls,
-            refresh_interval=self.controller.refresh_interval,
-            mode=self.controller.mode
-        )
+        # 最后，将当前设置写回到 config.json（延迟写盘，见 _do_flush）
+        self._pending_cfg = {
+            "urls": self.controller.urls,
+            "refresh_interval": self.controller.refresh_interval,
+            "mode": self.controller.mode
+        }
+        self._flush_timer.start(SAVE_DEBOUNCE_MS)
         QMessageBox.information(self, "提示", "设置已保存！")
 
+    def _do_flush(self):
+        """把最近一次待保存的设置写入 config.json"""
+        self._flush_timer.stop()
+        if self._pending_cfg is None:
+            return
+        cfg, self._pending_cfg = self._pending_cfg, None
+        save_config(**cfg)
+
 
 if __name__ == "__main__":
+    # 延迟导入 QtWebEngine 时，需要在创建 QApplication 之前设置共享 OpenGL 上下文
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
 
     # 加载配置
@@ -300,4 +409,7 @@ if __name__ == "__main__":
     settings_window = SettingsWindow(controller)
     settings_window.show()
 
+    # 退出前把尚未写盘的设置保存下来
+    app.aboutToQuit.connect(settings_window._do_flush)
+
     sys.exit(app.exec_())
\ No newline at end of file
@@ -1,28 +1,189 @@
 import sys
 import os
+import copy
 import json
+from collections import OrderedDict
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QGridLayout, QWidget,
-    QPushButton, QListWidget, QLineEdit, QLabel, QMessageBox
+    QPushButton, QListWidget, QListWidgetItem, QLineEdit, QLabel, QMessageBox
+)
+from PyQt6.QtGui import QIntValidator, QPixmap
+from PyQt6.QtCore import (
+    QCoreApplication, QTimer, QUrl, Qt, QObject, QEvent, pyqtSignal
 )
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtCore import QTimer, QUrl, Qt, QObject, QEvent
 
 CONFIG_FILE = "config.json"
 
+# Delay before a pending config write is flushed to disk (ms)
+SAVE_DEBOUNCE_MS = 500
+
+# In-memory copy of what config.json currently holds (None until read/written).
+_CONFIG_CACHE = None
+
+# QWebEngineView pulls in Chromium, so it is imported on first use only.
+_QWebEngineView = None
+
+# One profile (and HTTP disk cache) shared by every view, created on first use.
+_SHARED_PROFILE = None
+
+# Already-loaded pages of closed views, keyed by URL and kept in LRU order, so
+# a mode toggle can show them at once and revalidate in the background.
+_PAGE_POOL = OrderedDict()
+_PAGE_POOL_SIZE = 16
+
+# Network manager shared by all image slots, created on first use
+# (QtNetwork is only imported then; most configs have no image slots).
+_NETWORK_MANAGER = None
+
+
+def _get_webview_cls():
+    """
+    Import QWebEngineView on first call and cache the class.
+    """
+    global _QWebEngineView
+    if _QWebEngineView is None:
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        _QWebEngineView = QWebEngineView
+    return _QWebEngineView
+
+
+def _get_shared_profile():
+    """
+    Create the shared QWebEngineProfile on first call and cache it.
+    Its HTTP cache lives in a 'webcache' folder next to config.json.
+    """
+    global _SHARED_PROFILE
+    if _SHARED_PROFILE is None:
+        from PyQt6.QtWebEngineCore import QWebEngineProfile
+        profile = QWebEngineProfile("signage", QApplication.instance())
+        profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        profile.setCachePath(
+            os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "webcache")
+        )
+        _SHARED_PROFILE = profile
+    return _SHARED_PROFILE
+
+
+def _make_webview():
+    """
+    Create a QWebEngineView whose page uses the shared profile.
+    The page is a child of the view; only pages that go into the page pool
+    are handed over to the profile (see _release_page).
+    """
+    from PyQt6.QtWebEngineCore import QWebEnginePage
+    view = _get_webview_cls()()
+    view.setPage(QWebEnginePage(_get_shared_profile(), view))
+    return view
+
+
+def _get_network_manager():
+    """
+    Import QtNetwork and create the shared QNetworkAccessManager on first call,
+    then cache it.
+    """
+    global _NETWORK_MANAGER
+    if _NETWORK_MANAGER is None:
+        from PyQt6.QtNetwork import QNetworkAccessManager
+        _NETWORK_MANAGER = QNetworkAccessManager(QApplication.instance())
+    return _NETWORK_MANAGER
+
+
+def _load_url(view, qurl):
+    """
+    Load qurl in the view and remember it as the view's page pool key.
+    The page's requestedUrl() can't be used for that, since Chromium
+    canonicalizes it (e.g. "https://example.com" -> "https://example.com/").
+    """
+    view.pool_key = qurl.toString()
+    view.setUrl(qurl)
+
+
+def _open_url(view, qurl, zoom_factor=1.0):
+    """
+    Show qurl in the view. If a pooled page already has it loaded, swap that
+    page in and reload it in the background (stale-while-revalidate);
+    otherwise load it from scratch.
+    A pooled page keeps the zoom of the view it came from, so it is reset to
+    zoom_factor here.
+    """
+    from PyQt6.QtWebEngineCore import QWebEnginePage
+    pooled = _PAGE_POOL.pop(qurl.toString(), None)
+    if pooled is None:
+        _load_url(view, qurl)
+        return
+    old_page = view.page()
+    pooled.setZoomFactor(zoom_factor)
+    pooled.setParent(view)
+    view.setPage(pooled)
+    view.pool_key = qurl.toString()
+    old_page.deleteLater()
+    pooled.triggerAction(QWebEnginePage.WebAction.Reload)
+
+
+def _release_page(view):
+    """
+    Put the view's page in the pool under the URL it was showing, evicting the
+    least recently used pages beyond _PAGE_POOL_SIZE.
+    The page is reparented to the shared profile, so deleting the view
+    doesn't take it along.
+    """
+    page = view.page()
+    key = getattr(view, "pool_key", "")
+    if not key or key in _PAGE_POOL:
+        page.deleteLater()
+        return
+    page.setParent(_get_shared_profile())
+    _PAGE_POOL[key] = page
+    while len(_PAGE_POOL) > _PAGE_POOL_SIZE:
+        _, evicted = _PAGE_POOL.popitem(last=False)
+        evicted.deleteLater()
+
+
+def _clear_page_pool():
+    """
+    Delete every pooled page. Connected to aboutToQuit (after the display
+    windows are closed), so the pages are gone before the profile is.
+    """
+    while _PAGE_POOL:
+        _, page = _PAGE_POOL.popitem()
+        page.deleteLater()
+
 
 class QuitEventFilter(QObject):
     """
     A global event filter to catch 'Q' key presses.
     Once 'Q' is pressed, the application quits.
+    This runs for every event in the application, so non-key events
+    return as early and cheaply as possible.
     """
+    _KEY_PRESS = QEvent.Type.KeyPress
+    _KEY_Q = Qt.Key.Key_Q
+
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.Type.KeyPress:
-            if event.key() == Qt.Key.Key_Q:
-                QApplication.quit()
-                return True
-        return super().eventFilter(obj, event)
+        if event.type() != self._KEY_PRESS:
+            return False
+        if event.key() == self._KEY_Q:
+            QApplication.quit()
+            return True
+        return False
+
+
+def default_config():
+    """
+    Build the default configuration, used when config.json is missing,
+    invalid, or lacks some of the keys.
+    """
+    return {
+        "pages": [
+            {"title": "Example 1", "url": "https://example.com"},
+            {"title": "Example 2", "url": "https://example.org"},
+            {"title": "Example 3", "url": "https://example.net"}
+        ],
+        "refresh_interval": 5000,
+        "mode": "single",
+        "slots_per_screen": 1
+    }
 
 
 def load_config():
@@ -30,44 +191,41 @@ def load_config():
     Load the configuration from config.json.
     The data structure is expected to have:
       - pages: a list of dicts with keys 'title' and 'url'
+        (optional 'type': 'web' (default) or 'image' for a static image slot)
       - refresh_interval: int
       - mode: str ('single' or 'multi')
       - slots_per_screen: int
 
     If the config file is not found or invalid, use default settings.
+    The parsed file is cached, so later calls do not touch the disk again.
     """
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is not None:
+        return _CONFIG_CACHE
+
     if os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
-            pages = data.get("pages", [
-                {"title": "Example 1", "url": "https://example.com"},
-                {"title": "Example 2", "url": "https://example.org"},
-                {"title": "Example 3", "url": "https://example.net"}
-            ])
+            # Only build the default page list if the file doesn't provide one
+            pages = data.get("pages")
+            if pages is None:
+                pages = default_config()["pages"]
             refresh_interval = data.get("refresh_interval", 5000)
             mode = data.get("mode", "single")
             slots_per_screen = data.get("slots_per_screen", 1)
-            return {
+            _CONFIG_CACHE = {
                 "pages": pages,
                 "refresh_interval": refresh_interval,
                 "mode": mode,
                 "slots_per_screen": slots_per_screen
             }
+            return _CONFIG_CACHE
         except Exception as e:
             print("Error loading config, using default settings:", e)
 
     # Default configuration if file not found or error
-    return {
-        "pages": [
-            {"title": "Example 1", "url": "https://example.com"},
-            {"title": "Example 2", "url": "https://example.org"},
-            {"title": "Example 3", "url": "https://example.net"}
-        ],
-        "refresh_interval": 5000,
-        "mode": "single",
-        "slots_per_screen": 1
-    }
+    return default_config()
 
 
 def save_config(pages, refresh_interval, mode, slots_per_screen):
@@ -80,30 +238,68 @@ def save_config(pages, refresh_interval, mode, slots_per_screen):
           "mode": ...,
           "slots_per_screen": ...
         }
+    Nothing is written if the data equals what is already on disk.
     """
+    global _CONFIG_CACHE
     data = {
         "pages": pages,
         "refresh_interval": refresh_interval,
         "mode": mode,
         "slots_per_screen": slots_per_screen
     }
+    if data == _CONFIG_CACHE:
+        return
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Serialize in memory, write the temp file in one go, then swap it in,
+        # so a crash never leaves a half-written config
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        tmp_file = CONFIG_FILE + ".tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_file, flags, 0o644)
+        try:
+            # os.write may write only part of the buffer; loop until all of it is out
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, CONFIG_FILE)
+        _CONFIG_CACHE = copy.deepcopy(data)
     except Exception as e:
         print("Error saving config:", e)
 
 
+# Schemes accepted as-is by format_url (a tuple lets startswith check both at once)
+_SCHEMES = ("http://", "https://")
+
+
 def format_url(url_str):
     """
     Add 'https://' if the string does not start with 'http://' or 'https://'.
     """
     url_str = url_str.strip()
-    if not (url_str.startswith("http://") or url_str.startswith("https://")):
+    if not url_str.startswith(_SCHEMES):
         url_str = "https://" + url_str
     return url_str
 
 
+def get_qurl(url_str):
+    """
+    Return a QUrl for the formatted url_str.
+    Callers build these once per window (see _qurls), not on every tick.
+    """
+    return QUrl(format_url(url_str))
+
+
+# (rows, cols) indexed by slots_per_screen; the last entry is also the fallback
+_GRID_TABLE = (
+    None,
+    (1, 1), (1, 2), (2, 2), (2, 2), (2, 3), (2, 3), (3, 3), (3, 3),
+    (3, 3), (3, 4), (3, 4), (3, 4), (4, 4), (4, 4), (4, 4), (4, 4),
+)
+
+
 def get_grid_for_slots(slots):
     """
     Return (rows, cols) for a given number of slots_per_screen.
@@ -117,22 +313,50 @@ def get_grid_for_slots(slots):
       - 13..16 -> 4x4
       - otherwise -> 4x4 (fallback)
     """
-    if slots <= 1:
-        return 1, 1
-    elif slots == 2:
-        return 1, 2
-    elif slots <= 4:
-        return 2, 2
-    elif slots <= 6:
-        return 2, 3
-    elif slots <= 9:
-        return 3, 3
-    elif slots <= 12:
-        return 3, 4
-    elif slots <= 16:
-        return 4, 4
-    else:
-        return 4, 4
+    return _GRID_TABLE[min(max(slots, 1), len(_GRID_TABLE) - 1)]
+
+
+def _make_layout_widget(layout_cls=QVBoxLayout, tight=False):
+    """
+    Create a QWidget with a new layout_cls layout installed on it.
+    With tight=True the layout has no margins and no spacing.
+    Returns (widget, layout).
+    """
+    widget = QWidget()
+    layout = layout_cls(widget)
+    if tight:
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+    return widget, layout
+
+
+def _set_central_layout(window, layout_cls=QVBoxLayout):
+    """
+    Give a QMainWindow a new central widget and return that widget's layout.
+    """
+    central_widget, layout = _make_layout_widget(layout_cls)
+    window.setCentralWidget(central_widget)
+    return layout
+
+
+def _teardown(win):
+    """
+    Close a display window and release its web views immediately,
+    instead of waiting for Python's GC to drop the Chromium renderers.
+    Their pages go to the page pool (bounded, see _release_page).
+    """
+    views = getattr(win, "views", None)
+    if views is None:
+        views = [getattr(win, "webview", None)]
+    for view in views:
+        if view is not None:
+            if isinstance(view, ImageSlotWidget):
+                view.release()
+            else:
+                _release_page(view)
+            view.deleteLater()
+    win.close()
+    win.deleteLater()
 
 
 class MainController:
@@ -142,7 +366,8 @@ class MainController:
       - pages (list of dictionaries with 'title' and 'url'),
       - refresh interval,
       - slots per screen,
-      - creation of windows for display.
+      - creation of windows for display,
+      - a single shared timer that drives every window's refresh.
     """
     def __init__(self, initial_config):
         self.mode = initial_config["mode"]
@@ -150,6 +375,20 @@ class MainController:
         self.refresh_interval = initial_config["refresh_interval"]
         self.slots_per_screen = initial_config["slots_per_screen"]
         self.windows = []
+        # Screens are only needed in multi mode; queried on first use and cached
+        # until a screen is plugged in or removed
+        self._screens = None
+        app = QApplication.instance()
+        app.screenAdded.connect(self._invalidate_screens)
+        app.screenRemoved.connect(self._invalidate_screens)
+
+        # One timer for all windows instead of one per window
+        self._tick_callbacks = []
+        self._tick_timer = QTimer()
+        self._tick_timer.timeout.connect(self._on_tick)
+
+        # Settings the current windows were built/updated with (see apply_mode)
+        self._applied_state = None
 
     def set_mode(self, mode):
         self.mode = mode
@@ -164,33 +403,110 @@ class MainController:
     def set_slots_per_screen(self, slots):
         self.slots_per_screen = slots
 
+    def screens(self):
+        """
+        Return the cached list of QScreen objects, querying Qt on first use.
+        """
+        if self._screens is None:
+            self._screens = QApplication.screens()
+        return self._screens
+
+    def refresh_screens(self):
+        """
+        Drop the cached screens so the next call to screens() re-queries Qt.
+        """
+        self._screens = None
+
+    def _invalidate_screens(self, *_):
+        # Slot for screenAdded/screenRemoved (the QScreen argument is not needed)
+        self.refresh_screens()
+
+    def register_tick(self, callback):
+        """
+        Call `callback` every refresh_interval milliseconds from the shared timer.
+        """
+        self._tick_callbacks.append(callback)
+
+    def _on_tick(self):
+        for callback in self._tick_callbacks:
+            callback()
+
+    def _display_state(self):
+        """
+        Snapshot of everything that affects the display windows.
+        """
+        screens = tuple(self.screens()) if self.mode == "multi" else ()
+        pages = tuple((p["title"], p["url"], p.get("type", "web")) for p in self.pages)
+        return self.mode, self.slots_per_screen, screens, pages, self.refresh_interval
+
+    def _split_pages(self, screens):
+        """
+        Each screen displays up to self.slots_per_screen consecutive pages.
+        """
+        slots = self.slots_per_screen
+        return [self.pages[i * slots:(i + 1) * slots] for i in range(len(screens))]
+
     def apply_mode(self):
         """
-        Close all existing windows and create new windows based on current mode.
+        Bring the display windows in line with the current settings.
+        Windows are only rebuilt when the mode or the screen/slot layout changed
+        (or they were closed); interval and page edits update them in place.
         """
+        state = self._display_state()
+        prev = self._applied_state
+        self._applied_state = state
+
+        if (prev is None or not self.windows
+                or not all(win.isVisible() for win in self.windows)):
+            self._rebuild_windows()
+            return
+
+        mode, slots, screens, pages, interval = state
+        prev_mode, prev_slots, prev_screens, prev_pages, prev_interval = prev
+        same_layout = (mode, slots, screens) == (prev_mode, prev_slots, prev_screens)
+        # In multi mode the page count and types decide what widget each cell holds
+        same_cells = [p[2] for p in pages] == [p[2] for p in prev_pages]
+        # Going to or from an empty page list starts or stops the rotation
+        emptied = bool(pages) != bool(prev_pages)
+        if not same_layout or emptied or (mode == "multi" and not same_cells):
+            self._rebuild_windows()
+            return
+
+        if pages != prev_pages:
+            if mode == "single":
+                self.windows[0].update_pages(self.pages)
+            else:
+                for win, screen_pages in zip(self.windows, self._split_pages(screens)):
+                    win.update_pages(screen_pages)
+        if interval != prev_interval:
+            self._tick_timer.setInterval(interval)
+
+    def close_windows(self):
+        """
+        Stop the timer and tear down every display window.
+        """
+        self._tick_timer.stop()
+        self._tick_callbacks.clear()
         for win in self.windows:
-            win.close()
+            _teardown(win)
         self.windows.clear()
 
+    def _rebuild_windows(self):
+        """
+        Close all existing windows and create new windows based on current mode.
+        """
+        self.close_windows()
+
         if self.mode == "single":
             # Single-screen rolling mode
             window = SingleScreenWindow(self.pages, self.refresh_interval)
+            self.register_tick(window.show_next_page)
             self.windows.append(window)
         else:
             # Multi-screen mode
-            app_screens = QApplication.screens()  # List of QScreen objects
-            page_index = 0
-
-            for screen in app_screens:
-                # Each screen might display up to self.slots_per_screen pages
-                screen_pages = []
-                for _ in range(self.slots_per_screen):
-                    if page_index < len(self.pages):
-                        screen_pages.append(self.pages[page_index])
-                        page_index += 1
-                    else:
-                        break
+            app_screens = self.screens()  # List of QScreen objects
 
+            for screen, screen_pages in zip(app_screens, self._split_pages(app_screens)):
                 # We create a window if we have pages or if slots_per_screen > 0
                 if screen_pages or self.slots_per_screen > 0:
                     geometry = screen.geometry()
@@ -202,16 +518,20 @@ class MainController:
                         x, y, w, h,
                         self.slots_per_screen
                     )
+                    self.register_tick(window.refresh_all_views)
                     self.windows.append(window)
 
         for win in self.windows:
             win.show()
 
+        if self._tick_callbacks:
+            self._tick_timer.start(self.refresh_interval)
+
 
 class SingleScreenWindow(QMainWindow):
     """
     Single-screen rolling mode window.
-    It cycles through the pages list every refresh_interval milliseconds.
+    It cycles through the pages list on every tick of the controller's timer.
     The title is displayed in a fixed-height label at the top,
     and the rest space is occupied by QWebEngineView.
     """
@@ -221,12 +541,11 @@ class SingleScreenWindow(QMainWindow):
         self.pages = pages
         self.refresh_interval = refresh_interval
         self.current_index = 0
+        # Format every URL once up front; the timer callback only indexes into this
+        self._qurls = [get_qurl(p["url"]) for p in self.pages]
 
         # Create a central widget with a vertical layout
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        layout = QVBoxLayout()
-        central_widget.setLayout(layout)
+        layout = _set_central_layout(self)
 
         # Title label (fixed height)
         self.title_label = QLabel("")
@@ -235,17 +554,27 @@ class SingleScreenWindow(QMainWindow):
         layout.addWidget(self.title_label)
 
         # QWebEngineView
-        self.webview = QWebEngineView()
+        self.webview = _make_webview()
         layout.addWidget(self.webview)
 
         # Set initial size
         self.setGeometry(100, 100, 800, 600)
 
-        # Timer for auto-switch
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.show_next_page)
-        self.timer.start(self.refresh_interval)
+        # Show the first page now (straight from the page pool if possible);
+        # later switches are driven by MainController's shared timer
+        if self.pages:
+            self.title_label.setText(self.pages[0]["title"])
+            _open_url(self.webview, self._qurls[0])
+            self.current_index = 1 % len(self.pages)
 
+    def update_pages(self, pages):
+        """
+        Switch to a new page list without recreating the window,
+        starting again from the first page.
+        """
+        self.pages = pages
+        self._qurls = [get_qurl(p["url"]) for p in self.pages]
+        self.current_index = 0
         self.show_next_page()
 
     def show_next_page(self):
@@ -254,7 +583,7 @@ class SingleScreenWindow(QMainWindow):
 
         page = self.pages[self.current_index]
         self.title_label.setText(page["title"])
-        self.webview.setUrl(QUrl(format_url(page["url"])))
+        _load_url(self.webview, self._qurls[self.current_index])
 
         self.current_index = (self.current_index + 1) % len(self.pages)
 
@@ -275,13 +604,87 @@ class NoSignalWidget(QWidget):
         self.setLayout(layout)
 
 
+class ImageSlotWidget(QLabel):
+    """
+    A lightweight slot for pages with "type": "image".
+    Fetches the URL with the shared QNetworkAccessManager and shows it as a
+    scaled pixmap, so no Chromium renderer is needed.
+    It mirrors the parts of QWebEngineView that MultiScreenWindow uses:
+    setUrl(), reload(), loadStarted and loadFinished.
+    """
+    loadStarted = pyqtSignal()
+    loadFinished = pyqtSignal(bool)
+
+    def __init__(self):
+        super().__init__()
+        self.setStyleSheet("background-color: black;")
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setMinimumSize(1, 1)  # don't let the pixmap size drive the grid
+        self._url = QUrl()
+        self._reply = None
+        self._pixmap = QPixmap()
+
+    def setUrl(self, qurl):
+        if self._reply is not None:
+            self._reply.abort()
+        self._url = qurl
+        self.reload()
+
+    def release(self):
+        """
+        Abort and free an in-flight fetch before the slot is deleted; the reply
+        belongs to the shared network manager, so it would otherwise leak.
+        """
+        reply, self._reply = self._reply, None
+        if reply is not None:
+            reply.finished.disconnect(self._on_reply_finished)
+            reply.abort()
+            reply.deleteLater()
+
+    def reload(self):
+        if self._reply is not None or self._url.isEmpty():
+            return
+        from PyQt6.QtNetwork import QNetworkRequest
+        self.loadStarted.emit()
+        self._reply = _get_network_manager().get(QNetworkRequest(self._url))
+        self._reply.finished.connect(self._on_reply_finished)
+
+    def _on_reply_finished(self):
+        from PyQt6.QtNetwork import QNetworkReply
+        reply, self._reply = self._reply, None
+        ok = False
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            pixmap = QPixmap()
+            ok = pixmap.loadFromData(reply.readAll())
+            if ok:
+                # On failure the previous image stays up
+                self._pixmap = pixmap
+                self._update_scaled()
+        reply.deleteLater()
+        self.loadFinished.emit(ok)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scaled()
+
+    def _update_scaled(self):
+        if not self._pixmap.isNull():
+            self.setPixmap(self._pixmap.scaled(
+                self.size(),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            ))
+
+
 class MultiScreenWindow(QMainWindow):
     """
     Multi-screen mode window.
     One window per screen, containing a grid layout of slots:
-      - If a page is assigned, display title (fixed height) + QWebEngineView
+      - If a page is assigned, display title (fixed height) + QWebEngineView,
+        or an ImageSlotWidget for pages with "type": "image"
       - Otherwise display a "No Signal" screen
-    Each QWebEngineView reloads periodically (refresh_interval) without rotation.
+    Each QWebEngineView reloads on every tick of the controller's timer,
+    without rotation.
     The grid layout is stretched so that each cell is evenly sized.
     """
     def __init__(self, pages, refresh_interval, x, y, width, height, slots_per_screen):
@@ -293,14 +696,13 @@ class MultiScreenWindow(QMainWindow):
         self.refresh_interval = refresh_interval
         self.slots_per_screen = slots_per_screen
 
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-
         rows, cols = get_grid_for_slots(self.slots_per_screen)
-        grid = QGridLayout()
-        central_widget.setLayout(grid)
+        grid = _set_central_layout(self, QGridLayout)
 
         self.views = []
+        self.title_labels = []
+        # Views whose page load is still in flight
+        self._loading = set()
         assigned_count = len(self.pages)
         total_cells = rows * cols
 
@@ -316,22 +718,25 @@ class MultiScreenWindow(QMainWindow):
 
             if cell_index < assigned_count:
                 # Container for title + webview
-                container = QWidget()
-                container_layout = QVBoxLayout()
-                container_layout.setContentsMargins(0, 0, 0, 0)
-                container_layout.setSpacing(0)
-                container.setLayout(container_layout)
+                container, container_layout = _make_layout_widget(tight=True)
 
                 # Title label (fixed height)
                 title_label = QLabel(self.pages[cell_index]["title"])
                 title_label.setFixedHeight(30)
                 title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 container_layout.addWidget(title_label)
-
-                # QWebEngineView
-                view = QWebEngineView()
-                view.page().setZoomFactor(0.8)
-                view.setUrl(QUrl(format_url(self.pages[cell_index]["url"])))
+                self.title_labels.append(title_label)
+
+                # QWebEngineView, or a plain image slot when JS isn't needed
+                page = self.pages[cell_index]
+                is_image = page.get("type", "web") == "image"
+                view = ImageSlotWidget() if is_image else _make_webview()
+                view.loadStarted.connect(lambda v=view: self._loading.add(v))
+                view.loadFinished.connect(lambda ok, v=view: self._on_load_finished(v, ok))
+                if is_image:
+                    view.setUrl(get_qurl(page["url"]))
+                else:
+                    _open_url(view, get_qurl(page["url"]), 0.8)
                 container_layout.addWidget(view)
 
                 self.views.append(view)
@@ -341,14 +746,39 @@ class MultiScreenWindow(QMainWindow):
                 no_signal = NoSignalWidget()
                 grid.addWidget(no_signal, r, c)
 
-        # Periodic reload
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.refresh_all_views)
-        self.timer.start(self.refresh_interval)
+    def update_pages(self, pages):
+        """
+        Show a new set of pages in the existing cells. The caller guarantees
+        the number of pages is unchanged, so the cells line up one to one.
+        """
+        for view, title_label, old, new in zip(self.views, self.title_labels, self.pages, pages):
+            title_label.setText(new["title"])
+            if new["url"] != old["url"]:
+                _load_url(view, get_qurl(new["url"]))
+        self.pages = pages
+
+    def _on_load_finished(self, view, ok):
+        """
+        Mark the view as idle; apply the zoom factor once the page actually exists,
+        rather than an extra renderer round trip before the first load.
+        Periodic reloads keep the zoom, so it is only set when it differs.
+        """
+        self._loading.discard(view)
+        if ok and not isinstance(view, ImageSlotWidget):
+            page = view.page()
+            if page.zoomFactor() != 0.8:
+                page.setZoomFactor(0.8)
 
     def refresh_all_views(self):
+        """
+        Reload every view, unless the window can't be seen.
+        Views that are still loading are left alone.
+        """
+        if not self.isVisible() or self.isMinimized():
+            return
         for view in self.views:
-            view.reload()
+            if view not in self._loading:
+                view.reload()
 
 
 class SettingsWindow(QMainWindow):
@@ -365,11 +795,16 @@ class SettingsWindow(QMainWindow):
         super().__init__()
         self.controller = controller
 
+        # Config writes are coalesced and flushed once the user stops saving
+        self._pending_cfg = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._do_flush)
+
         self.setWindowTitle("Settings Window")
         self.setGeometry(50, 50, 400, 600)
 
-        central_widget = QWidget()
-        layout = QVBoxLayout()
+        layout = _set_central_layout(self)
 
         # ===== Title + URL input area =====
         layout.addWidget(QLabel("Enter Title:"))
@@ -393,7 +828,7 @@ class SettingsWindow(QMainWindow):
         # Current page list
         self.page_list = QListWidget()
         for p in controller.pages:
-            self.page_list.addItem(f"{p['title']} | {p['url']}")
+            self._add_page_item(p)
         layout.addWidget(self.page_list)
 
         # ===== Mode toggle button =====
@@ -405,6 +840,7 @@ class SettingsWindow(QMainWindow):
         layout.addWidget(QLabel("Refresh interval (ms):"))
         self.refresh_input = QLineEdit()
         self.refresh_input.setPlaceholderText("e.g. 5000 means 5 seconds")
+        self.refresh_input.setValidator(QIntValidator(1, 3_600_000, self))
         self.refresh_input.setText(str(self.controller.refresh_interval))
         layout.addWidget(self.refresh_input)
 
@@ -412,6 +848,7 @@ class SettingsWindow(QMainWindow):
         layout.addWidget(QLabel("Slots per screen (how many views on one screen):"))
         self.slots_input = QLineEdit()
         self.slots_input.setPlaceholderText("e.g. 2 => left-right split, 4 => 2x2, etc.")
+        self.slots_input.setValidator(QIntValidator(1, 64, self))
         self.slots_input.setText(str(self.controller.slots_per_screen))
         layout.addWidget(self.slots_input)
 
@@ -425,9 +862,6 @@ class SettingsWindow(QMainWindow):
         quit_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(quit_label)
 
-        central_widget.setLayout(layout)
-        self.setCentralWidget(central_widget)
-
         self.update_mode_button_text()
 
     def add_page_to_list(self):
@@ -442,10 +876,20 @@ class SettingsWindow(QMainWindow):
             QMessageBox.information(self, "Info", "Please enter both title and URL!")
             return
 
-        self.page_list.addItem(f"{new_title} | {new_url}")
+        self._add_page_item({"title": new_title, "url": new_url})
         self.title_input.clear()
         self.url_input.clear()
 
+    def _add_page_item(self, page):
+        """
+        Append a page to the QListWidget, keeping the page dict on the item
+        (UserRole) so it never has to be parsed back out of the display text.
+        Extra keys such as "type" are kept as-is.
+        """
+        item = QListWidgetItem(f"{page['title']} | {page['url']}")
+        item.setData(Qt.ItemDataRole.UserRole, dict(page))
+        self.page_list.addItem(item)
+
     def remove_selected_page(self):
         """
         Remove the currently selected item from the QListWidget.
@@ -481,49 +925,55 @@ class SettingsWindow(QMainWindow):
         """
         Collect all data, save to config, re-apply layout via the controller.
         """
-        # Collect pages
-        pages = []
-        for i in range(self.page_list.count()):
-            item_text = self.page_list.item(i).text()
-            # Format: "title | url"
-            if " | " in item_text:
-                title_part, url_part = item_text.split(" | ", 1)
-                pages.append({"title": title_part, "url": url_part})
-
-        self.controller.set_pages(pages)
-
-        # Refresh interval
-        try:
-            refresh_interval = int(self.refresh_input.text().strip())
-            self.controller.set_refresh_interval(refresh_interval)
-        except ValueError:
+        # Numbers first, so nothing is collected or applied if one is invalid.
+        # The validators accept locale group separators ("5,000"), so parse
+        # with the same locale instead of int().
+        refresh_interval, ok = self.refresh_input.locale().toInt(self.refresh_input.text())
+        if not self.refresh_input.hasAcceptableInput() or not ok:
             QMessageBox.warning(self, "Warning", "Refresh interval must be a valid integer!")
             return
-
-        # Slots per screen
-        try:
-            slots = int(self.slots_input.text().strip())
-            if slots < 1:
-                raise ValueError("slots must be >= 1")
-            self.controller.set_slots_per_screen(slots)
-        except ValueError:
+        slots, ok = self.slots_input.locale().toInt(self.slots_input.text())
+        if not self.slots_input.hasAcceptableInput() or not ok:
             QMessageBox.warning(self, "Warning", "Slots per screen must be a valid positive integer!")
             return
 
+        # Collect pages
+        pages = [
+            self.page_list.item(i).data(Qt.ItemDataRole.UserRole)
+            for i in range(self.page_list.count())
+        ]
+
+        self.controller.set_pages(pages)
+        self.controller.set_refresh_interval(refresh_interval)
+        self.controller.set_slots_per_screen(slots)
+
         # Apply new layout
         self.controller.apply_mode()
 
-        # Save to JSON
-        save_config(
-            pages=self.controller.pages,
-            refresh_interval=self.controller.refresh_interval,
-            mode=self.controller.mode,
-            slots_per_screen=self.controller.slots_per_screen
-        )
+        # Save to JSON (deferred, see _do_flush)
+        self._pending_cfg = {
+            "pages": self.controller.pages,
+            "refresh_interval": self.controller.refresh_interval,
+            "mode": self.controller.mode,
+            "slots_per_screen": self.controller.slots_per_screen
+        }
+        self._flush_timer.start(SAVE_DEBOUNCE_MS)
         QMessageBox.information(self, "Info", "Settings saved and applied!")
 
+    def _do_flush(self):
+        """
+        Write the latest pending settings to config.json, if any.
+        """
+        self._flush_timer.stop()
+        if self._pending_cfg is None:
+            return
+        cfg, self._pending_cfg = self._pending_cfg, None
+        save_config(**cfg)
+
 
 if __name__ == "__main__":
+    # Required before QApplication when QtWebEngine is imported lazily
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
 
     # Install global event filter to quit on 'Q' press
@@ -540,5 +990,11 @@ if __name__ == "__main__":
     settings_window = SettingsWindow(controller)
     settings_window.show()
 
+    # Make sure a pending config write is not lost on quit
+    app.aboutToQuit.connect(settings_window._do_flush)
+    # No page (live or pooled) may outlive the shared profile during teardown
+    app.aboutToQuit.connect(controller.close_windows)
+    app.aboutToQuit.connect(_clear_page_pool)
+
     # In PyQt6, use app.exec() instead of app.exec_()
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,22 +1,63 @@
 import sys
 import os
-import json
+import itertools
+
+# 优先使用 C 实现的 orjson，未安装时退回标准库 json。
+# 两种情况下 json_loads() 都接收 bytes，json_dumps() 都返回 bytes。
+# 输出保持 2 空格缩进：config.json 随仓库发布，需要方便手工编辑。
+try:
+    import orjson
+
+    def json_loads(raw):
+        return orjson.loads(raw)
+
+    def json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def json_loads(raw):
+        return json.loads(raw)
+
+    def json_dumps(data):
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QGridLayout, QWidget,
     QPushButton, QListWidget, QLineEdit, QLabel, QMessageBox
 )
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QTimer, QUrl
-from screeninfo import get_monitors
+from PyQt5.QtCore import QCoreApplication, QTimer, QUrl, Qt
 
 CONFIG_FILE = "config.json"
+# 读写 config.json 时使用的缓冲区大小（64 KiB），整个文件一次读入/写出
+CONFIG_IO_BUFFER = 64 * 1024
+# 定时刷新的最小间隔（毫秒），过短的间隔会迫使系统提高定时器精度、白白耗电
+MIN_REFRESH_INTERVAL = 2000
+
+# QWebEngineView 会拉起整个 Chromium，推迟到真正创建展示窗口时再导入
+_QWebEngineView = None
+
+def _get_webview_cls():
+    """首次调用时导入 QWebEngineView 并缓存，之后直接返回缓存的类。"""
+    global _QWebEngineView
+    if _QWebEngineView is None:
+        from PyQt5.QtWebEngineWidgets import QWebEngineView
+        _QWebEngineView = QWebEngineView
+    return _QWebEngineView
+
+def _make_webview(profile):
+    """创建一个使用共享 profile 的 QWebEngineView"""
+    from PyQt5.QtWebEngineWidgets import QWebEnginePage
+    view = _get_webview_cls()()
+    view.setPage(QWebEnginePage(profile, view))
+    return view
 
 def load_config():
     """从 config.json 加载配置，如果没有则使用默认配置。"""
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(CONFIG_FILE, "rb", buffering=CONFIG_IO_BUFFER) as f:
+                data = json_loads(f.read())
             # 如果文件内容里缺少某些字段，可以设置默认
             urls = data.get("urls", [
                 "https://example.com",
@@ -26,6 +67,8 @@ def load_config():
             refresh_interval = data.get("refresh_interval", 5000)
             mode = data.get("mode", "single")
             slots_per_screen = data.get("slots_per_screen", 1)
+            # 旧配置或手工编辑的网址可能未规范化，加载时统一处理一次
+            urls = [format_url(u) for u in urls]
             return {
                 "urls": urls,
                 "refresh_interval": refresh_interval,
@@ -55,15 +98,23 @@ def save_config(urls, refresh_interval, mode, slots_per_screen):
         "slots_per_screen": slots_per_screen
     }
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # 先完整写入临时文件并落盘，再用 os.replace 原子替换，中途崩溃也不会留下半截的 config.json
+        tmp_file = CONFIG_FILE + ".tmp"
+        with open(tmp_file, "wb", buffering=CONFIG_IO_BUFFER) as f:
+            f.write(json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
     except Exception as e:
         print("保存配置文件出错:", e)
 
+# format_url 认可的协议前缀，startswith 传入元组只需一次调用
+_SCHEMES = ("http://", "https://")
+
 def format_url(url_str):
     """如果用户没有输入 http:// 或 https://, 则自动补全为 https://"""
     url_str = url_str.strip()
-    if not (url_str.startswith("http://") or url_str.startswith("https://")):
+    if not url_str.startswith(_SCHEMES):
         url_str = "https://" + url_str
     return url_str
 
@@ -79,6 +130,16 @@ class MainController:
         self.refresh_interval = initial_config["refresh_interval"]
         self.slots_per_screen = initial_config["slots_per_screen"]
         self.windows = []
+        # 显示器信息首次用到时才探测并缓存，见 monitors()
+        self._monitors = None
+        # 当前窗口所基于的设置，见 apply_mode()
+        self._last_config = None
+        # 所有视图共用的 QWebEngineProfile（共享磁盘 HTTP 缓存），首次使用时创建，见 profile()
+        self._profile = None
+        # 所有窗口共用一个定时器，每次触发时调用各窗口的 on_tick()
+        self._tick_timer = QTimer()
+        self._tick_timer.setTimerType(Qt.CoarseTimer)
+        self._tick_timer.timeout.connect(self._on_tick)
 
     def set_mode(self, mode):
         self.mode = mode
@@ -93,8 +154,96 @@ class MainController:
     def set_slots_per_screen(self, slots):
         self.slots_per_screen = slots
 
+    def apply_batch(self, mode=None, urls=None, refresh_interval=None, slots_per_screen=None):
+        """一次性更新给出的各项设置，只重建一次窗口"""
+        if mode is not None:
+            self.mode = mode
+        if urls is not None:
+            self.urls = urls
+        if refresh_interval is not None:
+            self.refresh_interval = refresh_interval
+        if slots_per_screen is not None:
+            self.slots_per_screen = slots_per_screen
+        self.apply_mode()
+
+    def monitors(self):
+        """返回缓存的显示器列表，首次调用时才导入 screeninfo 并探测"""
+        if self._monitors is None:
+            from screeninfo import get_monitors
+            self._monitors = list(get_monitors())
+        return self._monitors
+
+    def profile(self):
+        """返回共享的 QWebEngineProfile，首次调用时创建；缓存目录为 config.json 旁的 webcache"""
+        if self._profile is None:
+            from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+            # 以 QApplication 为父对象，保证 profile 在所有页面之后才销毁
+            profile = QWebEngineProfile("shared", QApplication.instance())
+            profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+            profile.setCachePath(
+                os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "webcache")
+            )
+            self._profile = profile
+        return self._profile
+
+    def refresh_monitors(self):
+        """丢弃缓存的显示器信息，下次使用时重新探测（用于热插拔显示器后）"""
+        self._monitors = None
+
+    def _tick_interval(self):
+        return max(self.refresh_interval, MIN_REFRESH_INTERVAL)
+
+    def _on_tick(self):
+        """把一次定时器触发分发给所有仍在显示的窗口"""
+        for win in self.windows:
+            if win.isVisible():
+                win.on_tick()
+
+    def _update_tick_timer(self):
+        """只有单屏模式且有网址可轮播时才运行定时器（多屏窗口只做静态显示），否则停掉"""
+        if self.mode == "single" and self.urls:
+            self._tick_timer.start(self._tick_interval())
+        else:
+            self._tick_timer.stop()
+
+    def _config_snapshot(self):
+        """决定展示窗口样子的全部设置"""
+        monitors = ()
+        if self.mode != "single":
+            monitors = tuple((m.x, m.y, m.width, m.height) for m in self.monitors())
+        return (self.mode, self.slots_per_screen, monitors,
+                tuple(self.urls), self.refresh_interval)
+
+    def _reuse_windows(self, config, last):
+        """如果改动允许，直接更新现有窗口；需要完整重建时返回 False"""
+        if last is None or not self.windows or not all(w.isVisible() for w in self.windows):
+            return False
+        # 模式、分屏数量和显示器布局决定了窗口结构
+        if config[:3] != last[:3]:
+            return False
+        urls_changed = config[3] != last[3]
+        if urls_changed and self.mode != "single":
+            return False
+        # 网址列表变为空或从空变为非空时重建窗口，否则旧页面会一直留在屏幕上
+        if urls_changed and not (config[3] and last[3]):
+            return False
+
+        if urls_changed:
+            self.windows[0].set_urls(self.urls)
+        if urls_changed or config[4] != last[4]:
+            self._update_tick_timer()
+        return True
+
     def apply_mode(self):
-        """根据当前设置，生成窗口并展示"""
+        """
+        根据当前设置，生成窗口并展示。
+        如果只改了刷新间隔（或单屏模式下只改了网址列表），直接更新现有窗口而不重建。
+        """
+        config = self._config_snapshot()
+        last, self._last_config = self._last_config, config
+        if self._reuse_windows(config, last):
+            return
+
         # 先关闭已有窗口
         for win in self.windows:
             win.close()
@@ -104,12 +253,13 @@ class MainController:
             # 单屏滚动，只需创建一个窗口
             window = SingleScreenWindow(
                 self.urls, 
-                self.refresh_interval
+                self.refresh_interval,
+                self.profile()
             )
             self.windows.append(window)
         else:
             # 多屏模式，为每个显示器创建一个窗口，每个窗口再分割成多份
-            monitors = get_monitors()
+            monitors = self.monitors()
             # 注意：如果网址比 (屏幕数 * slots_per_screen) 还多，
             # 这里只取前面的内容作为演示。如果想循环或滚动，可以自行扩展。
             idx = 0
@@ -127,41 +277,52 @@ class MainController:
                         window_urls,
                         self.refresh_interval,
                         monitor,
-                        self.slots_per_screen
+                        self.slots_per_screen,
+                        self.profile()
                     )
                     self.windows.append(window)
 
         # 显示窗口
         for win in self.windows:
             win.show()
+        self._update_tick_timer()
 
 
 class SingleScreenWindow(QMainWindow):
     """
     单屏滚动窗口：每隔一段时间依次滚动显示所有URL
     """
-    def __init__(self, urls, refresh_interval):
+    def __init__(self, urls, refresh_interval, profile):
         super().__init__()
         self.setWindowTitle("单屏滚动模式")
         self.urls = urls
         self.refresh_interval = refresh_interval
-        self.current_index = 0
+        # 网址在加载/保存配置时已规范化，这里只需构造一次 QUrl，定时器回调里从循环迭代器中取下一个
+        self._qurls = [QUrl(u) for u in self.urls]
+        self._cycle = itertools.cycle(self._qurls)
 
-        self.webview = QWebEngineView()
+        self.webview = _make_webview(profile)
         self.setCentralWidget(self.webview)
         self.setGeometry(100, 100, 800, 600)
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.show_next_url)
-        self.timer.start(self.refresh_interval)
+        # 先显示第一个：放到事件循环里执行，让窗口先完成首次绘制，再初始化 WebEngine
+        QTimer.singleShot(0, self.show_next_url)
 
-        # 先显示第一个
+    def set_urls(self, urls):
+        """不重建窗口，直接切换到新的网址列表"""
+        self.urls = urls
+        self._qurls = [QUrl(u) for u in self.urls]
+        self._cycle = itertools.cycle(self._qurls)
         self.show_next_url()
 
     def show_next_url(self):
-        url = format_url(self.urls[self.current_index])
-        self.webview.setUrl(QUrl(url))
-        self.current_index = (self.current_index + 1) % len(self.urls)
+        # 网址列表为空时什么也不做（对空列表调用 next() 会抛出 StopIteration）
+        if not self._qurls:
+            return
+        self.webview.setUrl(next(self._cycle))
+
+    def on_tick(self):
+        self.show_next_url()
 
 
 class MultiScreenWindow(QMainWindow):
@@ -170,7 +331,7 @@ class MultiScreenWindow(QMainWindow):
     如果 slots_per_screen=2，就在这个窗口里创建2个 QWebEngineView，
     并将其竖直或网格排列。每个子视图只显示一个URL（不滚动）。
     """
-    def __init__(self, window_urls, refresh_interval, screen_info, slots_per_screen):
+    def __init__(self, window_urls, refresh_interval, screen_info, slots_per_screen, profile):
         super().__init__()
         self.setWindowTitle("多屏展示模式")
         self.setGeometry(screen_info.x, screen_info.y, screen_info.width, screen_info.height)
@@ -178,6 +339,7 @@ class MultiScreenWindow(QMainWindow):
         self.window_urls = window_urls
         self.refresh_interval = refresh_interval
         self.slots_per_screen = slots_per_screen
+        self._qurls = [QUrl(u) for u in self.window_urls]
 
         # 主布局（示例中使用垂直布局，如需网格可改用QGridLayout）
         central_widget = QWidget()
@@ -187,11 +349,13 @@ class MultiScreenWindow(QMainWindow):
 
         # 为每个URL创建一个WebEngineView
         # 这里只做静态显示，可自行拓展成定时刷新或轮播
-        for i, url in enumerate(self.window_urls):
-            view = QWebEngineView()
+        self.views = []
+        for qurl in self._qurls:
+            view = _make_webview(profile)
             layout.addWidget(view)
-            url = format_url(url)
-            view.setUrl(QUrl(url))
+            self.views.append(view)
+        # 网页等窗口首次绘制后再加载
+        QTimer.singleShot(0, self._load_views)
         
         # 如果想要做2x2网格，可使用QGridLayout，如下示例：
         # grid = QGridLayout()
@@ -203,6 +367,10 @@ class MultiScreenWindow(QMainWindow):
         #     url = format_url(url)
         #     view.setUrl(QUrl(url))
 
+    def _load_views(self):
+        for view, qurl in zip(self.views, self._qurls):
+            view.setUrl(qurl)
+
 
 class SettingsWindow(QMainWindow):
     """
@@ -237,6 +405,8 @@ class SettingsWindow(QMainWindow):
         # 显示目前网址列表
         self.url_list = QListWidget()
         self.url_list.addItems(controller.urls)
+        # 与列表控件同步的网址副本，保存时无需逐项读取控件
+        self._urls_model = list(controller.urls)
         layout.addWidget(self.url_list)
 
         # ============== 模式切换按钮 ==============
@@ -258,6 +428,11 @@ class SettingsWindow(QMainWindow):
         self.slots_input.setText(str(self.controller.slots_per_screen))
         layout.addWidget(self.slots_input)
 
+        # ============== 重新检测显示器 ==============
+        redetect_button = QPushButton("重新检测显示器")
+        redetect_button.clicked.connect(self.redetect_monitors)
+        layout.addWidget(redetect_button)
+
         # ============== 保存设置按钮 ==============
         save_button = QPushButton("保存设置")
         save_button.clicked.connect(self.save_settings)
@@ -274,6 +449,7 @@ class SettingsWindow(QMainWindow):
         new_url = self.url_input.text().strip()
         if new_url:
             self.url_list.addItem(new_url)
+            self._urls_model.append(new_url)
             self.url_input.clear()
 
     def remove_selected_url(self):
@@ -282,9 +458,16 @@ class SettingsWindow(QMainWindow):
         if selected_item:
             row = self.url_list.row(selected_item)
             self.url_list.takeItem(row)
+            del self._urls_model[row]
         else:
             QMessageBox.information(self, "提示", "请先选中要删除的网址！")
 
+    def redetect_monitors(self):
+        """接入或拔出显示器后重新探测，多屏模式下立即按新的显示器布局重建窗口"""
+        self.controller.refresh_monitors()
+        if self.controller.mode == "multi":
+            self.controller.apply_mode()
+
     def toggle_mode(self):
         """单屏和多屏模式之间切换"""
         if self.controller.mode == "single":
@@ -301,30 +484,37 @@ class SettingsWindow(QMainWindow):
 
     def save_settings(self):
         """保存设置到控制器并写回JSON"""
-        # 读取网址列表
-        urls = [self.url_list.item(i).text() for i in range(self.url_list.count())]
-        self.controller.set_urls(urls)
-
+        # 先校验所有输入，全部有效后再一次性交给控制器
         # 刷新间隔
+        refresh_text = self.refresh_input.text().strip()
+        # isdigit() 先挡掉常见的非数字输入，不必走异常路径；int() 的异常只作兜底（如上标数字）
         try:
-            refresh_interval = int(self.refresh_input.text().strip())
-            self.controller.set_refresh_interval(refresh_interval)
+            refresh_interval = int(refresh_text) if refresh_text.isdigit() else None
         except ValueError:
+            refresh_interval = None
+        if refresh_interval is None:
             QMessageBox.warning(self, "警告", "刷新间隔必须是数字！")
             return
 
         # 分屏数量
+        slots_text = self.slots_input.text().strip()
         try:
-            slots = int(self.slots_input.text().strip())
-            if slots < 1:
-                raise ValueError("slots must be >= 1")
-            self.controller.set_slots_per_screen(slots)
+            slots = int(slots_text) if slots_text.isdigit() else 0
         except ValueError:
+            slots = 0
+        if slots < 1:
             QMessageBox.warning(self, "警告", "分割数量必须是有效的正整数！")
             return
 
-        # 重新应用设置
-        self.controller.apply_mode()
+        # 读取网址列表，并在保存时一次性规范化（展示窗口不再逐个调用 format_url）
+        urls = [format_url(u) for u in self._urls_model]
+
+        # 重新应用设置（所有字段一起更新，只重建一次窗口）
+        self.controller.apply_batch(
+            urls=urls,
+            refresh_interval=refresh_interval,
+            slots_per_screen=slots
+        )
 
         # 保存到 JSON 文件
         save_config(
@@ -337,6 +527,8 @@ class SettingsWindow(QMainWindow):
 
 
 if __name__ == "__main__":
+    # 延迟导入 QtWebEngine 时，需要在创建 QApplication 之前设置共享 OpenGL 上下文
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
 
     # 加载配置
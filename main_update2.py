@@ -1,23 +1,70 @@
 import sys
 import os
-import json
+import math
+import itertools
+
+# Prefer orjson (C-backed) when installed, otherwise fall back to stdlib json.
+# Either way json_loads() takes bytes and json_dumps() returns bytes.
+# Output stays indented: config.json ships in the repo and is meant to be edited by hand.
+try:
+    import orjson
+
+    def json_loads(raw):
+        return orjson.loads(raw)
+
+    def json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def json_loads(raw):
+        return json.loads(raw)
+
+    def json_dumps(data):
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QGridLayout, QWidget,
     QPushButton, QListWidget, QLineEdit, QLabel, QMessageBox
 )
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QTimer, QUrl, Qt
-from screeninfo import get_monitors
+from PyQt5.QtCore import QCoreApplication, QTimer, QUrl, Qt
 
 CONFIG_FILE = "config.json"
+# Buffer size for config.json I/O (64 KiB): the whole file goes through in one read/write
+CONFIG_IO_BUFFER = 64 * 1024
+# Shortest refresh interval actually used (ms); shorter ones force a finer system timer resolution
+MIN_REFRESH_INTERVAL = 2000
+# Shortest gap between two staggered multi-screen reloads (ms); with many views a
+# round then takes longer than the refresh interval instead of waking up more often
+MIN_TICK_INTERVAL = 500
+
+# QWebEngineView pulls in Chromium, so it is imported on first use only.
+_QWebEngineView = None
+
+
+def _get_webview_cls():
+    """Import QWebEngineView on first call and cache the class."""
+    global _QWebEngineView
+    if _QWebEngineView is None:
+        from PyQt5.QtWebEngineWidgets import QWebEngineView
+        _QWebEngineView = QWebEngineView
+    return _QWebEngineView
+
+
+def _make_webview(profile):
+    """Create a QWebEngineView whose page uses the given shared profile."""
+    from PyQt5.QtWebEngineWidgets import QWebEnginePage
+    view = _get_webview_cls()()
+    view.setPage(QWebEnginePage(profile, view))
+    return view
 
 
 def load_config():
     """Load settings from config.json, or return default if not present/invalid."""
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(CONFIG_FILE, "rb", buffering=CONFIG_IO_BUFFER) as f:
+                data = json_loads(f.read())
             urls = data.get("urls", [
                 "https://example.com",
                 "https://example.org",
@@ -26,6 +73,8 @@ def load_config():
             refresh_interval = data.get("refresh_interval", 5000)
             mode = data.get("mode", "single")
             slots_per_screen = data.get("slots_per_screen", 1)
+            # Older or hand-edited configs may hold non-canonical URLs; normalize them once here
+            urls = [format_url(u) for u in urls]
             return {
                 "urls": urls,
                 "refresh_interval": refresh_interval,
@@ -57,16 +106,26 @@ def save_config(urls, refresh_interval, mode, slots_per_screen):
         "slots_per_screen": slots_per_screen
     }
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write the whole file to a temp file and fsync it, then swap it in with os.replace,
+        # so a crash mid-save never leaves a half-written config.json behind
+        tmp_file = CONFIG_FILE + ".tmp"
+        with open(tmp_file, "wb", buffering=CONFIG_IO_BUFFER) as f:
+            f.write(json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
     except Exception as e:
         print("Error saving config:", e)
 
 
+# Schemes accepted as-is by format_url (a tuple lets startswith check both at once)
+_SCHEMES = ("http://", "https://")
+
+
 def format_url(url_str):
     """If user doesn't start with http:// or https://, prepend https://"""
     url_str = url_str.strip()
-    if not (url_str.startswith("http://") or url_str.startswith("https://")):
+    if not url_str.startswith(_SCHEMES):
         url_str = "https://" + url_str
     return url_str
 
@@ -74,34 +133,19 @@ def format_url(url_str):
 def get_grid_for_slots(slots):
     """
     Return (rows, cols) for a given number of slots_per_screen.
-    We define some simple rules:
     - 1 -> 1x1
     - 2 -> 1x2
-    - 3,4 -> 2x2
-    - 5,6 -> 2x3
-    - 7,8,9 -> 3x3
-    - 10..12 -> 3x4
-    - 13..16 -> 4x4
-    etc.
-    You can expand or modify these rules as needed.
+    - otherwise the smallest near-square grid: cols = ceil(sqrt(slots)),
+      rows = ceil(slots / cols), e.g. 3,4 -> 2x2, 5,6 -> 2x3, 7..9 -> 3x3,
+      10..12 -> 3x4, 13..16 -> 4x4, 17..20 -> 4x5
     """
     if slots <= 1:
         return (1, 1)
-    elif slots == 2:
+    if slots == 2:
         return (1, 2)
-    elif slots <= 4:
-        return (2, 2)
-    elif slots <= 6:
-        return (2, 3)
-    elif slots <= 9:
-        return (3, 3)
-    elif slots <= 12:
-        return (3, 4)
-    elif slots <= 16:
-        return (4, 4)
-    else:
-        # fallback for very large slots
-        return (4, 4)
+    cols = math.ceil(math.sqrt(slots))
+    rows = math.ceil(slots / cols)
+    return (rows, cols)
 
 
 class MainController:
@@ -115,6 +159,16 @@ class MainController:
         self.refresh_interval = initial_config["refresh_interval"]
         self.slots_per_screen = initial_config["slots_per_screen"]
         self.windows = []
+        # Monitors are detected on first use and cached, see monitors()
+        self._monitors = None
+        # Settings the current windows were built with, see apply_mode()
+        self._last_config = None
+        # QWebEngineProfile shared by every view (one disk HTTP cache), created on first use, see profile()
+        self._profile = None
+        # One timer for all windows; each tick calls every window's on_tick()
+        self._tick_timer = QTimer()
+        self._tick_timer.setTimerType(Qt.CoarseTimer)
+        self._tick_timer.timeout.connect(self._on_tick)
 
     def set_mode(self, mode):
         self.mode = mode
@@ -129,8 +183,112 @@ class MainController:
     def set_slots_per_screen(self, slots):
         self.slots_per_screen = slots
 
+    def apply_batch(self, mode=None, urls=None, refresh_interval=None, slots_per_screen=None):
+        """Update any of the given settings, then rebuild the windows only once."""
+        if mode is not None:
+            self.mode = mode
+        if urls is not None:
+            self.urls = urls
+        if refresh_interval is not None:
+            self.refresh_interval = refresh_interval
+        if slots_per_screen is not None:
+            self.slots_per_screen = slots_per_screen
+        self.apply_mode()
+
+    def monitors(self):
+        """Return the cached monitor list, importing screeninfo and detecting on first use."""
+        if self._monitors is None:
+            from screeninfo import get_monitors
+            self._monitors = list(get_monitors())
+        return self._monitors
+
+    def profile(self):
+        """Return the shared QWebEngineProfile, creating it on first use; its cache lives in webcache/ next to config.json."""
+        if self._profile is None:
+            from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+            # Parented to the application so it outlives every page using it
+            profile = QWebEngineProfile("shared", QApplication.instance())
+            profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+            profile.setCachePath(
+                os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "webcache")
+            )
+            self._profile = profile
+        return self._profile
+
+    def refresh_monitors(self):
+        """Drop the cached monitors so the next monitors() call detects them again (hotplug)."""
+        self._monitors = None
+
+    def _on_tick(self):
+        """Dispatch one timer tick to every window that is still shown."""
+        for win in self.windows:
+            if win.isVisible():
+                win.on_tick()
+
+    def _update_tick_timer(self):
+        """
+        (Re)start the shared timer, or stop it when no window has anything to do.
+        Single mode ticks once per interval. Multi mode ticks once per view of the
+        busiest window within the interval, but never faster than MIN_TICK_INTERVAL.
+        """
+        interval = max(self.refresh_interval, MIN_REFRESH_INTERVAL)
+        if self.mode == "single":
+            if self.urls:
+                self._tick_timer.start(interval)
+            else:
+                self._tick_timer.stop()
+            return
+
+        busiest = max((len(win.views) for win in self.windows), default=0)
+        if not busiest:
+            self._tick_timer.stop()
+            return
+        for win in self.windows:
+            win.tick_round = busiest
+        self._tick_timer.start(max(interval // busiest, MIN_TICK_INTERVAL))
+
+    def _config_snapshot(self):
+        """Everything that decides what the display windows look like."""
+        monitors = ()
+        if self.mode != "single":
+            monitors = tuple((m.x, m.y, m.width, m.height) for m in self.monitors())
+        return (self.mode, self.slots_per_screen, monitors,
+                tuple(self.urls), self.refresh_interval)
+
+    def _reuse_windows(self, config, last):
+        """
+        Update the existing windows in place if the change allows it.
+        Returns False when a full rebuild is needed.
+        """
+        if last is None or not self.windows or not all(w.isVisible() for w in self.windows):
+            return False
+        # Mode, slots and monitor layout decide the window/grid topology
+        if config[:3] != last[:3]:
+            return False
+        urls_changed = config[3] != last[3]
+        if urls_changed and self.mode != "single":
+            return False
+        # Going to or from an empty list swaps the web view for a "No Signal" screen
+        if urls_changed and not (config[3] and last[3]):
+            return False
+
+        if urls_changed:
+            self.windows[0].set_urls(self.urls)
+        if urls_changed or config[4] != last[4]:
+            self._update_tick_timer()
+        return True
+
     def apply_mode(self):
-        """Close old windows and create new ones based on current mode."""
+        """
+        Close old windows and create new ones based on current mode.
+        If only the interval (or, in single mode, the URL list) changed,
+        the existing windows are updated instead of rebuilt.
+        """
+        config = self._config_snapshot()
+        last, self._last_config = self._last_config, config
+        if self._reuse_windows(config, last):
+            return
+
         # Close existing windows
         for win in self.windows:
             win.close()
@@ -140,12 +298,13 @@ class MainController:
             # Single-screen scrolling
             window = SingleScreenWindow(
                 self.urls,
-                self.refresh_interval
+                self.refresh_interval,
+                self.profile()
             )
             self.windows.append(window)
         else:
             # Multi-screen mode: each screen is a window, each window has up to slots_per_screen "cells"
-            monitors = get_monitors()
+            monitors = self.monitors()
             idx = 0
             for monitor in monitors:
                 # We will allocate 'slots_per_screen' URLs to each monitor in order
@@ -163,40 +322,55 @@ class MainController:
                         window_urls,
                         self.refresh_interval,
                         monitor,
-                        self.slots_per_screen
+                        self.slots_per_screen,
+                        self.profile()
                     )
                     self.windows.append(window)
 
         for win in self.windows:
             win.show()
+        self._update_tick_timer()
 
 
 class SingleScreenWindow(QMainWindow):
     """
     Single-screen rolling: each refresh interval displays next URL.
     """
-    def __init__(self, urls, refresh_interval):
+    def __init__(self, urls, refresh_interval, profile):
         super().__init__()
         self.setWindowTitle("Single-Screen Rolling Mode")
         self.urls = urls
         self.refresh_interval = refresh_interval
-        self.current_index = 0
+        # URLs arrive canonical (format_url runs at load/save time); build the QUrls once
+        self._qurls = [QUrl(u) for u in self.urls]
+        self._cycle = itertools.cycle(self._qurls)
 
-        self.webview = QWebEngineView()
-        self.setCentralWidget(self.webview)
+        if self._qurls:
+            self.webview = _make_webview(profile)
+            self.setCentralWidget(self.webview)
+        else:
+            # Nothing to rotate => show the "No Signal" screen instead of an empty web view
+            self.webview = None
+            self.setCentralWidget(NoSignalWidget())
         self.setGeometry(100, 100, 800, 600)
 
-        # Timer for auto switch
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.show_next_url)
-        self.timer.start(self.refresh_interval)
+        # Load the first URL from the event loop, so the window paints before WebEngine starts up
+        QTimer.singleShot(0, self.show_next_url)
 
+    def set_urls(self, urls):
+        """Switch to a new URL list without recreating the window."""
+        self.urls = urls
+        self._qurls = [QUrl(u) for u in self.urls]
+        self._cycle = itertools.cycle(self._qurls)
         self.show_next_url()
 
     def show_next_url(self):
-        url = format_url(self.urls[self.current_index])
-        self.webview.setUrl(QUrl(url))
-        self.current_index = (self.current_index + 1) % len(self.urls)
+        if not self._qurls:
+            return
+        self.webview.setUrl(next(self._cycle))
+
+    def on_tick(self):
+        self.show_next_url()
 
 
 class NoSignalWidget(QWidget):
@@ -223,7 +397,7 @@ class MultiScreenWindow(QMainWindow):
     or a black "No Signal" screen if no URL is assigned. 
     All webviews reload at the specified refresh interval (no rotation).
     """
-    def __init__(self, window_urls, refresh_interval, screen_info, slots_per_screen):
+    def __init__(self, window_urls, refresh_interval, screen_info, slots_per_screen, profile):
         super().__init__()
         self.setWindowTitle("Multi-Screen Mode")
         self.setGeometry(screen_info.x, screen_info.y, screen_info.width, screen_info.height)
@@ -231,6 +405,7 @@ class MultiScreenWindow(QMainWindow):
         self.window_urls = window_urls  # e.g. 0~slots-1 URLs assigned
         self.refresh_interval = refresh_interval
         self.slots_per_screen = slots_per_screen
+        self._qurls = [QUrl(u) for u in self.window_urls]
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -242,9 +417,12 @@ class MultiScreenWindow(QMainWindow):
 
         # We'll keep references to the views so we can reload them periodically
         self.views = []
+        self._rr_index = 0
+        # Ticks per reload round, set by the controller to the busiest window's view count
+        self.tick_round = 1
 
         # Fill each cell in the grid
-        assigned_count = len(self.window_urls)
+        assigned_count = len(self._qurls)
         idx = 0
         total_cells = rows * cols
 
@@ -253,12 +431,9 @@ class MultiScreenWindow(QMainWindow):
             c = cell_index % cols
             if cell_index < assigned_count:
                 # We have a real URL to display
-                url_str = format_url(self.window_urls[cell_index])
-                view = QWebEngineView()
+                view = _make_webview(profile)
                 # Optional: set a zoom factor so content fits better
                 view.page().setZoomFactor(0.8)
-
-                view.setUrl(QUrl(url_str))
                 grid.addWidget(view, r, c)
                 self.views.append(view)
             else:
@@ -266,17 +441,23 @@ class MultiScreenWindow(QMainWindow):
                 no_signal = NoSignalWidget()
                 grid.addWidget(no_signal, r, c)
 
-        # If the user wants each cell to automatically refresh (but not rotate):
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.refresh_all_views)
-        self.timer.start(self.refresh_interval)
+        # Start loading the pages only after the window has painted once
+        QTimer.singleShot(0, self._load_views)
 
-    def refresh_all_views(self):
+    def _load_views(self):
+        for view, qurl in zip(self.views, self._qurls):
+            view.setUrl(qurl)
+
+    def on_tick(self):
         """
-        Periodically reload each assigned URL (no rotation).
+        Called by the controller's shared timer tick_round times per reload round.
+        Reload the next view round-robin (no rotation), so every view refreshes
+        once per round but not all at the same moment. Windows with fewer views
+        than the busiest one just skip the extra ticks.
         """
-        for view in self.views:
-            view.reload()
+        if self._rr_index < len(self.views):
+            self.views[self._rr_index].reload()
+        self._rr_index = (self._rr_index + 1) % max(self.tick_round, 1)
 
 
 class SettingsWindow(QMainWindow):
@@ -316,6 +497,8 @@ class SettingsWindow(QMainWindow):
         # Current URL list
         self.url_list = QListWidget()
         self.url_list.addItems(controller.urls)
+        # Python-side copy of the list, kept in sync so saving needs no widget traversal
+        self._urls_model = list(controller.urls)
         layout.addWidget(self.url_list)
 
         # ===== Mode toggle button =====
@@ -337,6 +520,11 @@ class SettingsWindow(QMainWindow):
         self.slots_input.setText(str(self.controller.slots_per_screen))
         layout.addWidget(self.slots_input)
 
+        # ===== Re-detect monitors =====
+        redetect_button = QPushButton("Re-detect Monitors")
+        redetect_button.clicked.connect(self.redetect_monitors)
+        layout.addWidget(redetect_button)
+
         # ===== Save settings =====
         save_button = QPushButton("Save Settings")
         save_button.clicked.connect(self.save_settings)
@@ -351,6 +539,7 @@ class SettingsWindow(QMainWindow):
         new_url = self.url_input.text().strip()
         if new_url:
             self.url_list.addItem(new_url)
+            self._urls_model.append(new_url)
             self.url_input.clear()
 
     def remove_selected_url(self):
@@ -358,9 +547,16 @@ class SettingsWindow(QMainWindow):
         if selected_item:
             row = self.url_list.row(selected_item)
             self.url_list.takeItem(row)
+            del self._urls_model[row]
         else:
             QMessageBox.information(self, "Info", "Please select a URL to delete!")
 
+    def redetect_monitors(self):
+        """After a monitor is plugged in or removed, detect again and rebuild multi-screen windows."""
+        self.controller.refresh_monitors()
+        if self.controller.mode == "multi":
+            self.controller.apply_mode()
+
     def toggle_mode(self):
         if self.controller.mode == "single":
             self.controller.set_mode("multi")
@@ -375,30 +571,38 @@ class SettingsWindow(QMainWindow):
             self.mode_button.setText("Switch to Single-Screen Mode")
 
     def save_settings(self):
-        # Collect URLs
-        urls = [self.url_list.item(i).text() for i in range(self.url_list.count())]
-        self.controller.set_urls(urls)
-
+        # Validate every input first, then hand them to the controller in one go
         # Refresh interval
+        refresh_text = self.refresh_input.text().strip()
+        # isdigit() rejects the usual bad input without raising; the except only catches
+        # the rare digits isdigit() accepts but int() does not (e.g. superscripts)
         try:
-            refresh_interval = int(self.refresh_input.text().strip())
-            self.controller.set_refresh_interval(refresh_interval)
+            refresh_interval = int(refresh_text) if refresh_text.isdigit() else None
         except ValueError:
+            refresh_interval = None
+        if refresh_interval is None:
             QMessageBox.warning(self, "Warning", "Refresh interval must be a valid number!")
             return
 
         # Slots per screen
+        slots_text = self.slots_input.text().strip()
         try:
-            slots = int(self.slots_input.text().strip())
-            if slots < 1:
-                raise ValueError("slots must be >= 1")
-            self.controller.set_slots_per_screen(slots)
+            slots = int(slots_text) if slots_text.isdigit() else 0
         except ValueError:
+            slots = 0
+        if slots < 1:
             QMessageBox.warning(self, "Warning", "Slots per screen must be a valid positive integer!")
             return
 
-        # Apply new layout
-        self.controller.apply_mode()
+        # Collect URLs, canonicalized once here so the display windows can use them as-is
+        urls = [format_url(u) for u in self._urls_model]
+
+        # Apply new layout (all fields at once, so the windows are rebuilt only once)
+        self.controller.apply_batch(
+            urls=urls,
+            refresh_interval=refresh_interval,
+            slots_per_screen=slots
+        )
 
         # Save to JSON
         save_config(
@@ -411,6 +615,8 @@ class SettingsWindow(QMainWindow):
 
 
 if __name__ == "__main__":
+    # Required before QApplication when QtWebEngine is imported lazily
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
 
     # Load config